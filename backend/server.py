@@ -1,18 +1,24 @@
-from fastapi import FastAPI, APIRouter, HTTPException
+from fastapi import FastAPI, APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import WriteConcern
+import functools
+import hashlib
 import os
 import logging
+import numpy as np
+import orjson
 from pathlib import Path
 from pydantic import BaseModel, Field
-from typing import List, Optional
+import time
+from array import array
+from collections import OrderedDict
+from typing import List, Literal, Optional
 import uuid
 from datetime import datetime
 
-# AI agents
-from ai_agents.agents import AgentConfig, SearchAgent, ChatAgent
-
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -22,61 +28,154 @@ class InMemoryDB:
     def __init__(self):
         self.collections = {
             'menu': [],
-            'orders': [],
             'status_checks': []
         }
+        # Secondary index per collection: {doc id -> doc} for O(1) lookups
+        self._indexes = {name: {} for name in self.collections}
+        # One wrapper per collection, built up front so get_collection never
+        # allocates on the request path. Orders get a columnar store so
+        # analytics scans touch contiguous arrays instead of per-order dicts.
+        self._wrappers = {
+            name: InMemoryCollection(data, self._indexes[name])
+            for name, data in self.collections.items()
+        }
+        self._wrappers['orders'] = InMemoryOrdersCollection()
 
     def get_collection(self, name):
-        return InMemoryCollection(self.collections[name])
+        return self._wrappers[name]
+
+
+def _matches_query(item, query):
+    for key, value in query.items():
+        if key not in item or item[key] != value:
+            return False
+    return True
 
 class InMemoryCollection:
-    def __init__(self, data):
+    def __init__(self, data, index):
         self.data = data
+        self._by_id = index
 
-    async def find(self, query=None):
+    # Methods are plain sync: there is nothing to await in-process, and fake
+    # async would pay coroutine creation and event-loop scheduling per call.
+    # The memory-variant handlers (bound at import time) call these directly;
+    # only the Motor variants await.
+    def find(self, query=None):
         if query is None:
             return InMemoryCursor(self.data)
         # Simple query matching
         filtered = []
         for item in self.data:
-            if self._matches_query(item, query):
+            if _matches_query(item, query):
                 filtered.append(item)
         return InMemoryCursor(filtered)
 
-    async def find_one(self, query):
+    def find_one(self, query):
+        # Fast path: queries constrained by primary key hit the index directly
+        if 'id' in query:
+            item = self._by_id.get(query['id'])
+            if item is not None and _matches_query(item, query):
+                return item
+            return None
         for item in self.data:
-            if self._matches_query(item, query):
+            if _matches_query(item, query):
                 return item
         return None
 
-    async def insert_one(self, document):
+    def insert_one(self, document):
         self.data.append(document)
-        return type('InsertResult', (), {'inserted_id': document.get('id')})()
-
-    async def insert_many(self, documents):
+        doc_id = document.get('id')
+        if doc_id is not None:
+            self._by_id[doc_id] = document
+        return type('InsertResult', (), {'inserted_id': doc_id})()
+
+    def insert_many(self, documents, ordered=True):
+        # ordered is accepted for Mongo API compatibility; inserts here are
+        # a plain extend either way
         self.data.extend(documents)
+        for document in documents:
+            doc_id = document.get('id')
+            if doc_id is not None:
+                self._by_id[doc_id] = document
         return type('InsertResult', (), {'inserted_ids': [d.get('id') for d in documents]})()
 
-    async def count_documents(self, query=None):
+    def count_documents(self, query=None):
         if query is None:
             return len(self.data)
         count = 0
         for item in self.data:
-            if self._matches_query(item, query):
+            if _matches_query(item, query):
                 count += 1
         return count
 
-    def _matches_query(self, item, query):
-        for key, value in query.items():
-            if key not in item or item[key] != value:
-                return False
-        return True
+class InMemoryOrdersCollection:
+    """Struct-of-arrays order store with the same interface as InMemoryCollection.
+
+    Each order field lives in its own parallel column; the numeric columns are
+    contiguous arrays, so scans like revenue totals or status counts stay
+    cache-friendly and are directly consumable by numpy. Rows are rebuilt into
+    dicts only when an API response needs one.
+    """
+
+    COLUMNS = ('id', 'customer_name', 'coffee_id', 'coffee_name',
+               'quantity', 'total_price', 'timestamp', 'status')
+
+    def __init__(self):
+        self.columns = {name: [] for name in self.COLUMNS}
+        self.columns['quantity'] = array('i')
+        self.columns['total_price'] = array('d')
+        self._row_by_id = {}
+
+    def to_dict(self, row):
+        return {name: self.columns[name][row] for name in self.COLUMNS}
+
+    def find(self, query=None):
+        rows = range(len(self.columns['id']))
+        if query is None:
+            return InMemoryCursor([self.to_dict(row) for row in rows])
+        matched = [self.to_dict(row) for row in rows
+                   if _matches_query(self.to_dict(row), query)]
+        return InMemoryCursor(matched)
+
+    def find_one(self, query):
+        if 'id' in query:
+            row = self._row_by_id.get(query['id'])
+            if row is None:
+                return None
+            item = self.to_dict(row)
+            return item if _matches_query(item, query) else None
+        for row in range(len(self.columns['id'])):
+            item = self.to_dict(row)
+            if _matches_query(item, query):
+                return item
+        return None
+
+    def insert_one(self, document):
+        for name in self.COLUMNS:
+            self.columns[name].append(document[name])
+        doc_id = document['id']
+        self._row_by_id[doc_id] = len(self.columns['id']) - 1
+        return type('InsertResult', (), {'inserted_id': doc_id})()
+
+    def insert_many(self, documents, ordered=True):
+        for document in documents:
+            self.insert_one(document)
+        return type('InsertResult', (), {'inserted_ids': [d['id'] for d in documents]})()
+
+    def count_documents(self, query=None):
+        if query is None:
+            return len(self.columns['id'])
+        if set(query) == {'status'}:
+            # Single-column scan, no row materialization
+            return self.columns['status'].count(query['status'])
+        return sum(1 for row in range(len(self.columns['id']))
+                   if _matches_query(self.to_dict(row), query))
 
 class InMemoryCursor:
     def __init__(self, data):
         self.data = data
 
-    async def to_list(self, length=None):
+    def to_list(self, length=None):
         return self.data[:length] if length else self.data
 
 # Logging config (moved up to be available early)
@@ -89,7 +188,17 @@ logger = logging.getLogger(__name__)
 # Database setup
 try:
     mongo_url = os.environ['MONGO_URL']
-    client = AsyncIOMotorClient(mongo_url)
+    # Sized pool and single-node ack keep write latency low and avoid pool
+    # starvation under concurrent fanout
+    client = AsyncIOMotorClient(
+        mongo_url,
+        maxPoolSize=100,
+        minPoolSize=10,
+        serverSelectionTimeoutMS=2000,
+        w=1,
+        journal=False,
+        retryWrites=True
+    )
     db = client[os.environ['DB_NAME']]
     logger.info("Using MongoDB")
 except Exception as e:
@@ -97,23 +206,63 @@ except Exception as e:
     db = InMemoryDB()
     client = None
 
-# AI agents init
-agent_config = AgentConfig()
-search_agent: Optional[SearchAgent] = None
-chat_agent: Optional[ChatAgent] = None
+# Resolve collections once so handlers never branch on the backend type or
+# allocate wrappers per request
+if isinstance(db, InMemoryDB):
+    menu_collection = db.get_collection('menu')
+    orders_collection = db.get_collection('orders')
+    status_collection = db.get_collection('status_checks')
+else:
+    menu_collection = db.menu
+    orders_collection = db.orders
+    # Status checks are non-durable telemetry: fire-and-forget writes
+    status_collection = db.status_checks.with_options(write_concern=WriteConcern(w=0))
+
+# AI agents init. The LangChain/MCP stack is heavy, so it is imported lazily
+# inside these cached factories: workers that only serve the coffee-shop
+# routes never pay the import cost in startup time or RSS. functools.cache
+# gives race-free lazy singletons (construction is synchronous, so coroutines
+# cannot interleave mid-build) without per-request None checks.
+@functools.cache
+def _get_agent_config():
+    from ai_agents.agents import AgentConfig
+    return AgentConfig()
+
+
+@functools.cache
+def _search_agent():
+    from ai_agents.agents import SearchAgent
+    return SearchAgent(_get_agent_config())
+
+
+@functools.cache
+def _chat_agent():
+    from ai_agents.agents import ChatAgent
+    return ChatAgent(_get_agent_config())
 
 # Main app
-app = FastAPI(title="AI Agents API", description="Minimal AI Agents API with LangGraph and MCP support")
+app = FastAPI(
+    title="AI Agents API",
+    description="Minimal AI Agents API with LangGraph and MCP support",
+    default_response_class=ORJSONResponse
+)
 
 # API router
 api_router = APIRouter(prefix="/api")
 
 
 # Models
+# Timestamps are stored as ISO-8601 strings: same wire format as serialized
+# datetimes, but the JSON encoder emits them as plain strings with no
+# per-request datetime conversion
+def _utcnow_iso() -> str:
+    return datetime.utcnow().isoformat(timespec='microseconds')
+
+
 class StatusCheck(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     client_name: str
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: str = Field(default_factory=_utcnow_iso)
 
 class StatusCheckCreate(BaseModel):
     client_name: str
@@ -135,7 +284,7 @@ class Order(BaseModel):
     coffee_name: str
     quantity: int = 1
     total_price: float
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    timestamp: str = Field(default_factory=_utcnow_iso)
     status: str = "pending"  # pending, confirmed, ready, completed
 
 class OrderCreate(BaseModel):
@@ -143,11 +292,16 @@ class OrderCreate(BaseModel):
     coffee_id: str
     quantity: int = 1
 
+class OrderBatchCreate(BaseModel):
+    orders: List[OrderCreate] = Field(min_length=1, max_length=500)
+
 
 # AI agent models
 class ChatRequest(BaseModel):
-    message: str
-    agent_type: str = "chat"  # "chat" or "search"
+    # Empty, oversized or unknown-agent requests are rejected by validation
+    # before they can cost an LLM roundtrip
+    message: str = Field(min_length=1, max_length=8000)
+    agent_type: Literal["chat", "search"] = "chat"
     context: Optional[dict] = None
 
 
@@ -173,58 +327,121 @@ class SearchResponse(BaseModel):
     sources_count: int
     error: Optional[str] = None
 
+# Seed data for the coffee menu; ids are generated in one pass at startup
+SAMPLE_MENU_ITEMS = [
+    {
+        "name": "Ethiopian Yirgacheffe",
+        "origin": "Yirgacheffe, Ethiopia",
+        "description": "Bright and floral with notes of lemon and tea-like qualities",
+        "price": 4.50,
+        "available": True
+    },
+    {
+        "name": "Colombian Supremo",
+        "origin": "Huila, Colombia",
+        "description": "Medium body with chocolate and nutty undertones",
+        "price": 4.25,
+        "available": True
+    },
+    {
+        "name": "Guatemalan Antigua",
+        "origin": "Antigua, Guatemala",
+        "description": "Full-bodied with smoky, spicy notes and bright acidity",
+        "price": 4.75,
+        "available": True
+    },
+    {
+        "name": "Kenya AA",
+        "origin": "Central Kenya",
+        "description": "Wine-like acidity with blackcurrant and citrus notes",
+        "price": 5.00,
+        "available": True
+    },
+    {
+        "name": "Brazil Santos",
+        "origin": "São Paulo, Brazil",
+        "description": "Smooth and balanced with chocolate and caramel sweetness",
+        "price": 4.00,
+        "available": True
+    }
+]
+
+
 # Routes
 @api_router.get("/")
 async def root():
     return {"message": "Hello World"}
 
-@api_router.post("/status", response_model=StatusCheck)
-async def create_status_check(input: StatusCheckCreate):
-    if isinstance(db, InMemoryDB):
-        collection = db.get_collection('status_checks')
-    else:
-        collection = db.status_checks
+# Status routes come in a memory and a Mongo variant; the live one is picked
+# once at import time (see the add_api_route calls below), so request handling
+# never branches on the backend or probes results for awaitability. The Mongo
+# variants project out _id to skip bson ObjectId conversion.
+async def _create_status_check_memory(input: StatusCheckCreate):
+    # Input is already validated; build the model and dump it once, then use
+    # the same dict for storage and response
+    payload = StatusCheck(client_name=input.client_name).model_dump(mode="json")
+    status_collection.insert_one(payload)
+    return ORJSONResponse(payload)
+
+async def _create_status_check_mongo(input: StatusCheckCreate):
+    payload = StatusCheck(client_name=input.client_name).model_dump(mode="json")
+    await status_collection.insert_one(payload)
+    # insert_one adds _id to the passed dict; strip it before serializing
+    payload.pop('_id', None)
+    return ORJSONResponse(payload)
+
+async def _get_status_checks_memory():
+    status_checks = status_collection.find().to_list(1000)
+    # Data was written by us, so skip re-validation on the way out
+    return [StatusCheck.model_construct(**status_check) for status_check in status_checks]
+
+async def _get_status_checks_mongo():
+    status_checks = await status_collection.find({}, {"_id": 0}).to_list(1000)
+    return [StatusCheck.model_construct(**status_check) for status_check in status_checks]
+
+create_status_check = _create_status_check_memory if client is None else _create_status_check_mongo
+get_status_checks = _get_status_checks_memory if client is None else _get_status_checks_mongo
+
+api_router.add_api_route(
+    "/status", create_status_check, methods=["POST"],
+    name="create_status_check", responses={200: {"model": StatusCheck}}
+)
+api_router.add_api_route(
+    "/status", get_status_checks, methods=["GET"],
+    name="get_status_checks", responses={200: {"model": List[StatusCheck]}}
+)
 
-    status_dict = input.dict()
-    status_obj = StatusCheck(**status_dict)
-    _ = await collection.insert_one(status_obj.dict())
-    return status_obj
 
-@api_router.get("/status", response_model=List[StatusCheck])
-async def get_status_checks():
-    if isinstance(db, InMemoryDB):
-        collection = db.get_collection('status_checks')
-    else:
-        collection = db.status_checks
+# Exact-repeat /chat requests within the TTL are answered from this cache,
+# skipping the LLM roundtrip entirely. Keyed by (agent_type, message); only
+# successful, context-free responses are cached.
+_CHAT_CACHE_TTL = 60.0
+_CHAT_CACHE_MAX = 512
+_chat_cache: OrderedDict = OrderedDict()  # key -> (ChatResponse, expires_at)
 
-    status_checks = await collection.find().to_list(1000)
-    return [StatusCheck(**status_check) for status_check in status_checks]
+# Agent factory per agent_type; membership is already guaranteed by the
+# Literal validation on ChatRequest.agent_type
+_AGENT_FACTORIES = {"chat": _chat_agent, "search": _search_agent}
 
 
 # AI agent routes
 @api_router.post("/chat", response_model=ChatResponse)
 async def chat_with_agent(request: ChatRequest):
     # Chat with AI agent
-    global search_agent, chat_agent
-    
     try:
-        # Init agents if needed
-        if request.agent_type == "search" and search_agent is None:
-            search_agent = SearchAgent(agent_config)
-            
-        elif request.agent_type == "chat" and chat_agent is None:
-            chat_agent = ChatAgent(agent_config)
-        
-        # Select agent
-        agent = search_agent if request.agent_type == "search" else chat_agent
-        
-        if agent is None:
-            raise HTTPException(status_code=500, detail="Failed to initialize agent")
-        
+        cache_key = (request.agent_type, request.message) if request.context is None else None
+        if cache_key is not None:
+            cached = _chat_cache.get(cache_key)
+            if cached is not None and cached[1] > time.monotonic():
+                return cached[0]
+
+        # Select agent (lazily built on first use)
+        agent = _AGENT_FACTORIES[request.agent_type]()
+
         # Execute agent
         response = await agent.execute(request.message)
-        
-        return ChatResponse(
+
+        chat_response = ChatResponse(
             success=response.success,
             response=response.content,
             agent_type=request.agent_type,
@@ -232,7 +449,14 @@ async def chat_with_agent(request: ChatRequest):
             metadata=response.metadata,
             error=response.error
         )
-        
+
+        if cache_key is not None and response.success:
+            _chat_cache[cache_key] = (chat_response, time.monotonic() + _CHAT_CACHE_TTL)
+            while len(_chat_cache) > _CHAT_CACHE_MAX:
+                _chat_cache.popitem(last=False)
+
+        return chat_response
+
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}")
         return ChatResponse(
@@ -247,13 +471,9 @@ async def chat_with_agent(request: ChatRequest):
 @api_router.post("/search", response_model=SearchResponse)
 async def search_and_summarize(request: SearchRequest):
     # Web search with AI summary
-    global search_agent
-    
     try:
-        # Init search agent if needed
-        if search_agent is None:
-            search_agent = SearchAgent(agent_config)
-        
+        search_agent = _search_agent()
+
         # Search with agent
         search_prompt = f"Search for information about: {request.query}. Provide a comprehensive summary with key findings."
         result = await search_agent.execute(search_prompt, use_tools=True)
@@ -286,18 +506,28 @@ async def search_and_summarize(request: SearchRequest):
         )
 
 
+# Capability lists are static per process, so build them once and reuse the
+# agent singletons instead of constructing throwaway agents per request
+_capabilities_cache: Optional[dict] = None
+
+
 @api_router.get("/agents/capabilities")
 async def get_agent_capabilities():
     # Get agent capabilities
+    global _capabilities_cache
+
+    if _capabilities_cache is not None:
+        return _capabilities_cache
+
     try:
-        capabilities = {
-            "search_agent": SearchAgent(agent_config).get_capabilities(),
-            "chat_agent": ChatAgent(agent_config).get_capabilities()
-        }
-        return {
+        _capabilities_cache = {
             "success": True,
-            "capabilities": capabilities
+            "capabilities": {
+                "search_agent": _search_agent().get_capabilities(),
+                "chat_agent": _chat_agent().get_capabilities()
+            }
         }
+        return _capabilities_cache
     except Exception as e:
         logger.error(f"Error getting capabilities: {e}")
         return {
@@ -306,55 +536,115 @@ async def get_agent_capabilities():
         }
 
 
-# Coffee shop routes
-@api_router.get("/menu", response_model=List[CoffeeItem])
-async def get_menu():
+# Cached /menu payload: the menu is effectively immutable after startup, so
+# serialize it once and serve the bytes directly instead of re-validating and
+# re-encoding on every request. _menu_by_id holds the same available items
+# keyed by id so create_order resolves coffees without a DB roundtrip.
+_menu_cache: Optional[bytes] = None
+_menu_etag: Optional[str] = None
+_menu_by_id: dict = {}
+
+# Pricing columns aligned with the cached menu: _id_to_index maps coffee id to
+# a row in _price_array so batch pricing is one vectorized multiply
+_price_array = np.empty(0, dtype=np.float64)
+_id_to_index: dict = {}
+
+
+async def _refresh_menu_cache():
+    """(Re)build the serialized /menu response and the by-id lookup.
+
+    Call after any menu mutation.
+    """
+    global _menu_cache, _menu_etag, _price_array
+    if client is None:
+        menu_items = menu_collection.find({"available": True}).to_list(100)
+    else:
+        menu_items = await menu_collection.find({"available": True}, {"_id": 0}).to_list(100)
+    _menu_cache = orjson.dumps(
+        [CoffeeItem.model_construct(**item).dict() for item in menu_items]
+    )
+    _menu_etag = f'"{hashlib.sha1(_menu_cache).hexdigest()}"'
+    _menu_by_id.clear()
+    _menu_by_id.update({item["id"]: item for item in menu_items})
+    _id_to_index.clear()
+    _id_to_index.update({item["id"]: i for i, item in enumerate(menu_items)})
+    _price_array = np.fromiter((item["price"] for item in menu_items),
+                               dtype=np.float64, count=len(menu_items))
+
+
+# Coffee shop routes. The read endpoints return trusted, pre-shaped data, so
+# they skip response_model re-validation; the schema is kept in OpenAPI via
+# the responses declaration.
+@api_router.get("/menu", responses={200: {"model": List[CoffeeItem]}})
+async def get_menu(request: Request):
     """Get all available coffee items"""
     try:
-        if isinstance(db, InMemoryDB):
-            collection = db.get_collection('menu')
-        else:
-            collection = db.menu
-        menu_items = await collection.find({"available": True}).to_list(100)
-        return [CoffeeItem(**item) for item in menu_items]
+        if _menu_cache is None:
+            await _refresh_menu_cache()
+        if request.headers.get("if-none-match") == _menu_etag:
+            return Response(status_code=304, headers={"ETag": _menu_etag})
+        return Response(
+            content=_menu_cache,
+            media_type="application/json",
+            headers={"ETag": _menu_etag}
+        )
     except Exception as e:
         logger.error(f"Error getting menu: {e}")
         raise HTTPException(status_code=500, detail="Failed to fetch menu")
 
 
-@api_router.post("/orders", response_model=Order)
-async def create_order(order_create: OrderCreate):
+def _build_order(order_create, coffee_item):
+    """Shared order assembly for both backend variants.
+
+    Returns a single dump of the order that serves as both the stored
+    document and the response body, so the order is materialized exactly once.
+    """
+    if not coffee_item:
+        raise HTTPException(status_code=404, detail="Coffee item not found or unavailable")
+
+    # Inputs are validated (OrderCreate) or trusted (menu), so construct
+    # without re-validation; defaults (id, timestamp, status) still apply
+    order = Order.model_construct(
+        customer_name=order_create.customer_name,
+        coffee_id=order_create.coffee_id,
+        quantity=order_create.quantity,
+        coffee_name=coffee_item["name"],
+        total_price=coffee_item["price"] * order_create.quantity
+    )
+    return order.model_dump(mode="json")
+
+
+async def _create_order_memory(order_create: OrderCreate):
     """Place a new order"""
     try:
-        # Get collections
-        if isinstance(db, InMemoryDB):
-            menu_collection = db.get_collection('menu')
-            orders_collection = db.get_collection('orders')
-        else:
-            menu_collection = db.menu
-            orders_collection = db.orders
-
-        # Get coffee item details
-        coffee_item = await menu_collection.find_one({"id": order_create.coffee_id, "available": True})
-        if not coffee_item:
-            raise HTTPException(status_code=404, detail="Coffee item not found or unavailable")
-
-        # Calculate total price
-        total_price = coffee_item["price"] * order_create.quantity
-
-        # Create order
-        order_data = {
-            **order_create.dict(),
-            "coffee_name": coffee_item["name"],
-            "total_price": total_price,
-            "status": "pending"
-        }
-        order = Order(**order_data)
+        # Common case: the finite menu is cached by id, no DB roundtrip
+        coffee_item = _menu_by_id.get(order_create.coffee_id)
+        if coffee_item is None:
+            coffee_item = menu_collection.find_one({"id": order_create.coffee_id, "available": True})
+        payload = _build_order(order_create, coffee_item)
+        orders_collection.insert_one(payload)
+        return ORJSONResponse(payload)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating order: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create order")
 
-        # Save to database
-        await orders_collection.insert_one(order.dict())
 
-        return order
+async def _create_order_mongo(order_create: OrderCreate):
+    """Place a new order"""
+    try:
+        # Common case: the finite menu is cached by id, no DB roundtrip
+        coffee_item = _menu_by_id.get(order_create.coffee_id)
+        if coffee_item is None:
+            coffee_item = await menu_collection.find_one(
+                {"id": order_create.coffee_id, "available": True}, {"_id": 0}
+            )
+        payload = _build_order(order_create, coffee_item)
+        await orders_collection.insert_one(payload)
+        # insert_one adds _id to the passed dict; strip it before serializing
+        payload.pop('_id', None)
+        return ORJSONResponse(payload)
     except HTTPException:
         raise
     except Exception as e:
@@ -362,19 +652,28 @@ async def create_order(order_create: OrderCreate):
         raise HTTPException(status_code=500, detail="Failed to create order")
 
 
-@api_router.get("/orders/{order_id}", response_model=Order)
-async def get_order(order_id: str):
+async def _get_order_memory(order_id: str):
     """Get order details by ID"""
     try:
-        if isinstance(db, InMemoryDB):
-            collection = db.get_collection('orders')
-        else:
-            collection = db.orders
+        order = orders_collection.find_one({"id": order_id})
+        if not order:
+            raise HTTPException(status_code=404, detail="Order not found")
+        # Trusted data written by create_order; skip re-validation
+        return Order.model_construct(**order)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error getting order: {e}")
+        raise HTTPException(status_code=500, detail="Failed to fetch order")
+
 
-        order = await collection.find_one({"id": order_id})
+async def _get_order_mongo(order_id: str):
+    """Get order details by ID"""
+    try:
+        order = await orders_collection.find_one({"id": order_id}, {"_id": 0})
         if not order:
             raise HTTPException(status_code=404, detail="Order not found")
-        return Order(**order)
+        return Order.model_construct(**order)
     except HTTPException:
         raise
     except Exception as e:
@@ -382,23 +681,105 @@ async def get_order(order_id: str):
         raise HTTPException(status_code=500, detail="Failed to fetch order")
 
 
+def _build_order_batch(batch):
+    """Price and assemble a batch of orders.
+
+    Totals for the whole batch are computed in one vectorized multiply over
+    the menu-aligned price array instead of a per-order Python loop.
+    """
+    count = len(batch.orders)
+    try:
+        idx = np.fromiter((_id_to_index[o.coffee_id] for o in batch.orders),
+                          dtype=np.intp, count=count)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Coffee item not found or unavailable")
+    quantities = np.fromiter((o.quantity for o in batch.orders),
+                             dtype=np.float64, count=count)
+    totals = _price_array[idx] * quantities
+    return [
+        Order.model_construct(
+            customer_name=o.customer_name,
+            coffee_id=o.coffee_id,
+            quantity=o.quantity,
+            coffee_name=_menu_by_id[o.coffee_id]["name"],
+            total_price=total
+        ).model_dump(mode="json")
+        for o, total in zip(batch.orders, totals.tolist())
+    ]
+
+
+async def _create_order_batch_memory(batch: OrderBatchCreate):
+    """Place several orders in one request"""
+    try:
+        payloads = _build_order_batch(batch)
+        orders_collection.insert_many(payloads)
+        return ORJSONResponse(payloads)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating order batch: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create orders")
+
+
+async def _create_order_batch_mongo(batch: OrderBatchCreate):
+    """Place several orders in one request"""
+    try:
+        payloads = _build_order_batch(batch)
+        await orders_collection.insert_many(payloads, ordered=False)
+        for payload in payloads:
+            payload.pop('_id', None)
+        return ORJSONResponse(payloads)
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error creating order batch: {e}")
+        raise HTTPException(status_code=500, detail="Failed to create orders")
+
+
+create_order = _create_order_memory if client is None else _create_order_mongo
+create_order_batch = _create_order_batch_memory if client is None else _create_order_batch_mongo
+get_order = _get_order_memory if client is None else _get_order_mongo
+
+api_router.add_api_route(
+    "/orders", create_order, methods=["POST"],
+    name="create_order", responses={200: {"model": Order}}
+)
+api_router.add_api_route(
+    "/orders/batch", create_order_batch, methods=["POST"],
+    name="create_order_batch", responses={200: {"model": List[Order]}}
+)
+api_router.add_api_route(
+    "/orders/{order_id}", get_order, methods=["GET"],
+    name="get_order", responses={200: {"model": Order}}
+)
+
+
+# Shop info is static, so serialize it once at import time; the terminal UI
+# polls this endpoint, so it also gets a long client cache
+_SHOP_INFO_BYTES = orjson.dumps({
+    "name": "Black Coffee Terminal",
+    "description": "Premium black coffee only. No cream, no sugar, no compromises.",
+    "location": "123 Terminal Street, Code City",
+    "hours": "Mon-Fri: 6:00 AM - 8:00 PM, Sat-Sun: 7:00 AM - 6:00 PM",
+    "philosophy": "We believe in the pure, unadulterated taste of quality coffee beans. Each cup is carefully selected and roasted to perfection.",
+    "commands": [
+        "menu - View our coffee selection",
+        "info - Learn about our shop",
+        "order <coffee_name> - Place an order",
+        "help - Show available commands",
+        "clear - Clear the terminal"
+    ]
+})
+
+
 @api_router.get("/info")
 async def get_shop_info():
     """Get coffee shop information"""
-    return {
-        "name": "Black Coffee Terminal",
-        "description": "Premium black coffee only. No cream, no sugar, no compromises.",
-        "location": "123 Terminal Street, Code City",
-        "hours": "Mon-Fri: 6:00 AM - 8:00 PM, Sat-Sun: 7:00 AM - 6:00 PM",
-        "philosophy": "We believe in the pure, unadulterated taste of quality coffee beans. Each cup is carefully selected and roasted to perfection.",
-        "commands": [
-            "menu - View our coffee selection",
-            "info - Learn about our shop",
-            "order <coffee_name> - Place an order",
-            "help - Show available commands",
-            "clear - Clear the terminal"
-        ]
-    }
+    return Response(
+        content=_SHOP_INFO_BYTES,
+        media_type="application/json",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 # Include router
 app.include_router(api_router)
@@ -414,63 +795,27 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def startup_event():
-    # Initialize agents on startup
-    global search_agent, chat_agent
     logger.info("Starting AI Agents API...")
 
     # Initialize coffee menu if empty
-    if isinstance(db, InMemoryDB):
-        collection = db.get_collection('menu')
+    if client is None:
+        menu_count = menu_collection.count_documents({})
     else:
-        collection = db.menu
+        # Back the id lookups in create_order/get_order with a real index
+        await menu_collection.create_index("id", unique=True)
+        await orders_collection.create_index("id", unique=True)
+        menu_count = await menu_collection.count_documents({})
 
-    menu_count = await collection.count_documents({})
     if menu_count == 0:
-        sample_menu = [
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Ethiopian Yirgacheffe",
-                "origin": "Yirgacheffe, Ethiopia",
-                "description": "Bright and floral with notes of lemon and tea-like qualities",
-                "price": 4.50,
-                "available": True
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Colombian Supremo",
-                "origin": "Huila, Colombia",
-                "description": "Medium body with chocolate and nutty undertones",
-                "price": 4.25,
-                "available": True
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Guatemalan Antigua",
-                "origin": "Antigua, Guatemala",
-                "description": "Full-bodied with smoky, spicy notes and bright acidity",
-                "price": 4.75,
-                "available": True
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Kenya AA",
-                "origin": "Central Kenya",
-                "description": "Wine-like acidity with blackcurrant and citrus notes",
-                "price": 5.00,
-                "available": True
-            },
-            {
-                "id": str(uuid.uuid4()),
-                "name": "Brazil Santos",
-                "origin": "São Paulo, Brazil",
-                "description": "Smooth and balanced with chocolate and caramel sweetness",
-                "price": 4.00,
-                "available": True
-            }
-        ]
-        await collection.insert_many(sample_menu)
+        sample_menu = [{"id": str(uuid.uuid4()), **item} for item in SAMPLE_MENU_ITEMS]
+        result = menu_collection.insert_many(sample_menu, ordered=False)
+        if client is not None:
+            await result
         logger.info("Sample coffee menu initialized")
 
+    # Warm the serialized menu cache so the first /menu hit is already cheap
+    await _refresh_menu_cache()
+
     # Lazy agent init for faster startup
     logger.info("AI Agents API ready!")
 
@@ -478,13 +823,27 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_db_client():
     # Cleanup on shutdown
-    global search_agent, chat_agent
-    
-    # Close MCP
-    if search_agent and search_agent.mcp_client:
+
+    # Close MCP (only if a search agent was ever built)
+    if _search_agent.cache_info().currsize and _search_agent().mcp_client:
         # MCP cleanup automatic
         pass
 
     if client:  # Only close if MongoDB client exists
         client.close()
     logger.info("AI Agents API shutdown complete.")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Production runner: libuv event loop + httptools parser (uvicorn[standard])
+    # cut per-request overhead versus the stdlib selector loop and h11
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=os.cpu_count()
+    )
@@ -73,6 +73,41 @@ class TestCoffeeShop:
         print(f"✓ Order placed successfully - {order['coffee_name']} x{order['quantity']} = ${order['total_price']}")
         return order
 
+    def test_place_batch_order(self):
+        """Test placing several orders in one batch request"""
+        # First get menu
+        menu_response = requests.get(f"{self.base_url}/menu")
+        assert menu_response.status_code == 200
+        menu = menu_response.json()
+        assert len(menu) >= 2
+
+        batch_data = {
+            "orders": [
+                {"customer_name": f"BatchCustomer_{int(time.time())}", "coffee_id": menu[0]["id"], "quantity": 2},
+                {"customer_name": f"BatchCustomer_{int(time.time())}", "coffee_id": menu[1]["id"], "quantity": 3}
+            ]
+        }
+
+        response = requests.post(f"{self.base_url}/orders/batch", json=batch_data)
+        assert response.status_code == 200
+
+        orders = response.json()
+        assert len(orders) == 2
+        assert orders[0]["total_price"] == menu[0]["price"] * 2
+        assert orders[1]["total_price"] == menu[1]["price"] * 3
+
+        # Each order should be individually retrievable
+        for order in orders:
+            status_response = requests.get(f"{self.base_url}/orders/{order['id']}")
+            assert status_response.status_code == 200
+
+        # Unknown coffee in the batch rejects the whole request
+        bad_batch = {"orders": [{"customer_name": "BatchCustomer", "coffee_id": "invalid-coffee-id", "quantity": 1}]}
+        bad_response = requests.post(f"{self.base_url}/orders/batch", json=bad_batch)
+        assert bad_response.status_code == 404
+
+        print(f"✓ Batch order placed successfully - {len(orders)} orders")
+
     def test_get_order_status(self):
         """Test getting order status"""
         # First place an order
@@ -159,6 +194,7 @@ if __name__ == "__main__":
         test.test_get_shop_info()
         test.test_get_menu()
         test.test_place_order_success()
+        test.test_place_batch_order()
         test.test_get_order_status()
         test.test_place_order_invalid_coffee()
         test.test_get_nonexistent_order()